@@ -21,6 +21,11 @@ import os
 import re
 import urllib
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
 from ansible.module_utils.basic import AnsibleModule
 import requests
 
@@ -144,6 +149,114 @@ json:
 '''
 
 
+class Parameter(object):
+    """ Descriptor for a single query parameter, shared between every route that declares the same one. """
+
+    __slots__ = ('name', 'type')
+
+    def __init__(self, name, param_type):
+        self.name = name
+        self.type = param_type
+
+    def __getitem__(self, key):
+        # Mapping-style access so code written against the raw specification dictionaries keeps working
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+class Route(object):
+    """ Compact API specification for one action on one resource.
+
+    Only the parts of the specification used when building requests are kept: the query parameter descriptors and,
+    for every path, the names of the path parameters it accepts.
+    """
+
+    __slots__ = ('query_parameters', 'path_parameters')
+
+    def __init__(self, query_parameters, path_parameters):
+        self.query_parameters = query_parameters
+        self.path_parameters = path_parameters
+
+    def __getitem__(self, key):
+        # Mapping-style access so code written against the raw specification dictionaries keeps working
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+class ApiSpec(Mapping):
+    """ Memory efficient, read-only view of the Gateway API specification.
+
+    Each resource is reduced to the fields `Gateway` needs and kept as a compact JSON encoded string. Descriptions,
+    `paths` lists and the descriptors of path parameters are not kept, only their names. A resource is only expanded
+    into `Route` objects the first time it is looked up, so resources that are never used stay cheap.
+    Resource, path and parameter names are interned in a table owned by the instance, so they are released with it,
+    and identical parameter descriptors are shared.
+    """
+
+    def __init__(self, resources):
+        self._encoded = {}
+        self._resources = {}
+        self._strings = {}
+        self._parameters = {}
+        self._parameter_names = {}
+
+        for resource, actions in resources.items():
+            compact = {}
+            for action, definition in actions.items():
+                compact[action] = [
+                    {name: value['type'] for name, value in definition.get('query_parameters', {}).items()},
+                    [[path, list(parameters)] for path, parameters in definition.get('path_parameters', {}).items()],
+                ]
+            self._encoded[self._intern(resource)] = json.dumps(compact, separators=(',', ':')).encode('utf8')
+
+    def __getitem__(self, resource):
+        if resource not in self._resources:
+            self._resources[resource] = self._load(self._encoded[resource])
+        return self._resources[resource]
+
+    def __iter__(self):
+        return iter(self._encoded)
+
+    def __len__(self):
+        return len(self._encoded)
+
+    def _load(self, encoded):
+        """ Expand a compact JSON encoded resource into `Route` objects.
+
+        :param encoded: Bytes produced for the resource when the specification was loaded.
+
+        :return: Dictionary mapping each action to its `Route`.
+        """
+        actions = {}
+        for action, (query_parameters, path_parameters) in json.loads(encoded.decode('utf8')).items():
+            actions[self._intern(action)] = Route(
+                {
+                    self._intern(name): self._parameter(name, param_type)
+                    for name, param_type in query_parameters.items()
+                },
+                OrderedDict(
+                    (self._intern(path), self._parameter_names_for(parameters)) for path, parameters in path_parameters
+                ),
+            )
+        return actions
+
+    def _intern(self, string):
+        # Unlike intern(), the table is released with the specification and accepts unicode on Python 2
+        return self._strings.setdefault(string, string)
+
+    def _parameter(self, name, param_type):
+        key = (self._intern(name), self._intern(param_type))
+        if key not in self._parameters:
+            self._parameters[key] = Parameter(*key)
+        return self._parameters[key]
+
+    def _parameter_names_for(self, names):
+        key = tuple(self._intern(name) for name in names)
+        return self._parameter_names.setdefault(key, key)
+
+
 class Gateway(object):
     def __init__(self, api_json, protocol, domain, version, username, password, mocked=False, **kwargs):
         self.base_url = '{protocol}://{domain}'.format(protocol=protocol, domain=domain)
@@ -152,10 +265,9 @@ class Gateway(object):
         self.password = password
 
         # If the `api_json` parameter is not provided explicitly, use API to request it
-        if api_json:
-            self.json = api_json
-        else:
-            self.json = self.get_api_json()
+        if not api_json:
+            api_json = self.get_api_json()
+        self.json = api_json if isinstance(api_json, ApiSpec) else ApiSpec(api_json)
 
         self.session = requests.Session()
         self.mocked = mocked
@@ -207,6 +319,34 @@ class Gateway(object):
         if self.mocked and action.lower() not in ['get']:
             return self.generate_mocked_response(resource, action)
 
+        # Begin user session
+        self.login(self.username, self.password)
+
+        action, url_path, query_params = self.build_request(resource, action)
+
+        # Perform action against the constructed resource path
+        response = self.session.request(action, self.api_url + url_path, json=query_params)
+
+        # End user session
+        self.logout()
+
+        return response
+
+    def build_request(self, resource, action, resource_path=None, json_data=None):
+        """ Resolve the REST verb, URL path and query parameters for an action against a resource.
+
+        :param resource: The name of the resource that the action should be performed on.
+        :param action: The REST verb that needs to be performed on the resource.
+        :param resource_path: List of one item dictionaries, defaults to the `resource_path` given on creation.
+        :param json_data: Dictionary of query parameter values, defaults to the `json_data` given on creation.
+
+        :return: Tuple of the HTTP method, the URL path relative to `api_url` and the query parameters.
+
+        :raises: Exception: If path parameters don't match any valid paths or match multiple paths.
+        """
+        if resource_path is None:
+            resource_path = self.resource_path
+
         resource = resource.lower()
         action = action.lower()
 
@@ -215,20 +355,17 @@ class Gateway(object):
             get_all = True
             action = 'get'
 
-        # Begin user session
-        self.login(self.username, self.password)
-
         # Get API specification for resource
         definition = self.json[resource][action]
 
         # Populate query_params with any matches in kwargs
-        query_params = self.parse_query_params(definition)
+        query_params = self.parse_query_params(definition, json_data)
 
         # Populate path_params with any matches in kwargs
         resources = OrderedDict()
-        for resource in self.resource_path:
+        for path_resource in resource_path:
             # There should only be one item in each resource defined in resource_path
-            for key, value in resource.items():
+            for key, value in path_resource.items():
                 resources[key] = value
 
         # Populate processed_path_params with paths that match user provided path parameters
@@ -259,13 +396,7 @@ class Gateway(object):
         if not url_path:
             raise Exception('Provided parameters do not match any valid paths!')
 
-        # Perform action against the constructed resource path
-        response = self.session.request(action, self.api_url + url_path, json=query_params)
-
-        # End user session
-        self.logout()
-
-        return response
+        return action, url_path, query_params
 
     def generate_mocked_response(self, resource, action):
         """ Create mock response object.
@@ -283,27 +414,31 @@ class Gateway(object):
 
         return response
 
-    def parse_query_params(self, definition):
+    def parse_query_params(self, definition, json_data=None):
         """ Parse query parameters associated with the resource being accessed.
 
-        :param definition: Dictionary representing the API specification for the resource.
+        :param definition: Dictionary or `Route` representing the API specification for the resource.
+        :param json_data: Dictionary of values supplied by the user, defaults to the `json_data` given on creation.
 
         :return: Dictionary containing parsed query parameters and their values.
         """
+        if json_data is None:
+            json_data = self.json_data
+
         query_params = {}
 
         # Parse values from the query keeping the type of the value in mind.
         for key, value in definition['query_parameters'].items():
-            if key in self.json_data:
-                if value['type'] == 'boolean' and isinstance(self.json_data[key], str):
-                    if self.json_data[key].lower() == 'true':
+            if key in json_data:
+                if value['type'] == 'boolean' and isinstance(json_data[key], str):
+                    if json_data[key].lower() == 'true':
                         query_params[key] = True
                     else:
                         query_params[key] = False
                 elif value['type'] == 'integer':
-                    query_params[key] = int(self.json_data[key])
+                    query_params[key] = int(json_data[key])
                 else:
-                    query_params[key] = self.json_data[key]
+                    query_params[key] = json_data[key]
 
         return query_params
 
@@ -311,7 +446,7 @@ class Gateway(object):
     def parse_path_params(definition, resources):
         """ Parse path(s) from API specification that match parameters supplied by user.
 
-        :param definition: Dictionary representing the API specification for the resource.
+        :param definition: Dictionary or `Route` representing the API specification for the resource.
         :param resources: Dictionary containing the parameters specified by the user.
 
         :return: Dictionary containing the matching paths and the corresponding parameters as values.
@@ -320,7 +455,7 @@ class Gateway(object):
 
         for path, parameters in definition['path_parameters'].items():
             # Make sure parameters user gave match parameters accepted by path
-            if set(parameters.keys()) != set(resources.keys()):
+            if set(parameters) != set(resources.keys()):
                 continue
 
             processed_path_params[path] = {}
@@ -382,7 +517,8 @@ def run_module():
     api_json = {}
     if os.path.isfile('gateway_api.json'):
         json_data = json.load(open('gateway_api.json'))
-        api_json = json_data['resources']
+        api_json = ApiSpec(json_data['resources'])
+        del json_data
         module_args['resource'] = dict(type='str', required=True, choices=api_json.keys())
     else:
         module_args['resource'] = dict(type='str', required=True)
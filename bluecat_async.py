@@ -0,0 +1,225 @@
+# Copyright 2018 BlueCat Networks (USA) Inc. and its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# By: BlueCat Networks
+
+""" Asynchronous client for BlueCat Gateway for use outside of Ansible.
+
+Kept separate from `bluecat.py` so the Ansible module itself has no dependency on `aiohttp` or `asyncio`.
+"""
+
+import asyncio
+import json
+
+import aiohttp
+
+from bluecat import ApiSpec, Gateway
+
+
+class MockedResponse(object):
+    """ Stand-in for `aiohttp.ClientResponse` returned by `AsyncGateway` when running mocked. """
+
+    def __init__(self, status, body):
+        self.status = status
+        self.headers = {'Content-Type': 'application/json'}
+        self._body = json.dumps(body).encode('utf8')
+
+    async def read(self):
+        return self._body
+
+    async def text(self, encoding='utf8'):
+        return self._body.decode(encoding)
+
+    async def json(self):
+        return json.loads(self._body.decode('utf8'))
+
+
+class AsyncGateway(Gateway):
+    """ Gateway client built on `aiohttp` that shares one authenticated session across requests.
+
+    Use as an asynchronous context manager, which logs in on entry and logs out on exit::
+
+        async with AsyncGateway(api_json, 'https', 'gateway.example.com', 1, username, password) as gateway:
+            response = await gateway.invoke('zone', 'getall', resource_path=[{'zone': 'example.com'}])
+
+    If `api_json` is empty the specification is requested from the Gateway when logging in. `limit` bounds the number
+    of concurrent connections and is the default bound for `gather`. `ssl` is passed to aiohttp: True verifies TLS
+    certificates, False skips verification, or an `ssl.SSLContext` can be given.
+    """
+
+    def __init__(self, api_json, protocol, domain, version, username, password, mocked=False, limit=100, ssl=True,
+                 **kwargs):
+        self.base_url = '{protocol}://{domain}'.format(protocol=protocol, domain=domain)
+        self.api_url = self.base_url + '/api/v{version}'.format(version=version)
+        self.username = username
+        self.password = password
+
+        self.json = None
+        if api_json:
+            self.json = api_json if isinstance(api_json, ApiSpec) else ApiSpec(api_json)
+
+        # The aiohttp session must be created from within a running event loop, see `login`
+        self.session = None
+        self.mocked = mocked
+        self.limit = limit
+        self.ssl = ssl
+
+        # List of one item dictionaries
+        self.resource_path = kwargs.get('resource_path', [])
+        self.json_data = kwargs.get('json_data', {})
+        self.response_key = {'PUT': 204, 'PATCH': 204, 'POST': 201, 'DELETE': 204}
+
+    async def __aenter__(self):
+        try:
+            await self.login(self.username, self.password)
+        except Exception:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.logout()
+
+    def create_session(self):
+        """ Create the HTTP session shared by all requests made through this client.
+
+        The cookie jar accepts cookies from IP address hosts so the login session is kept when `domain` is an IP.
+
+        :return: A new ClientSession object.
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.limit, ssl=self.ssl),
+            cookie_jar=aiohttp.CookieJar(unsafe=True),
+        )
+
+    async def get_api_json(self):
+        """ Request JSON containing Gateway API specification.
+
+        :return: Dictionary representing the API specification.
+        """
+        async with self.session.get(self.api_url + '/gateway_api_json/') as response:
+            return (await response.json())['resources']
+
+    async def login(self, username, password):
+        """ Authenticate and establish the user session shared by all requests made through this client.
+
+        Requests the API specification first if none was provided on creation.
+
+        :param username: Username for the user being signed in as.
+        :param password: Password associated with the given username.
+
+        :raises: aiohttp.ClientResponseError: If the Gateway rejects the login.
+        """
+        if self.session is None:
+            self.session = self.create_session()
+
+        if self.json is None:
+            self.json = ApiSpec(await self.get_api_json())
+
+        async with self.session.post(
+            '{base_url}/rest_login'.format(base_url=self.base_url),
+            data={'username': username, 'password': password},
+        ) as response:
+            await response.read()
+            # The session is shared by every later request, so a rejected login must not go unnoticed
+            response.raise_for_status()
+
+    async def logout(self):
+        """ End currently established user session and close the underlying HTTP session. """
+        if self.session is None:
+            return
+
+        try:
+            async with self.session.get('{base_url}/logout'.format(base_url=self.base_url)) as response:
+                await response.read()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """ Close the underlying HTTP session without ending the user session. """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def invoke(self, resource, action, resource_path=None, json_data=None):
+        """ Request a REST action to be performed against the specified resource.
+
+        Unlike `Gateway.invoke`, the session is not opened and closed around every request; `login` must have
+        been called first, usually by entering the client as a context manager.
+
+        :param resource: The name of the resource that the action should be performed on.
+        :param action: The REST verb that needs to be performed on the resource.
+        :param resource_path: List of one item dictionaries, defaults to the `resource_path` given on creation.
+        :param json_data: Dictionary of query parameter values, defaults to the `json_data` given on creation.
+
+        :return: The result of performing the action as a ClientResponse object with its body already read, or a
+            MockedResponse when running mocked.
+
+        :raises: Exception: If path parameters don't match any valid paths or match multiple paths.
+        """
+        # If the client is being tested with a request that can modify a resource, return a mock response
+        if self.mocked and action.lower() not in ['get', 'getall']:
+            return self.generate_mocked_response(resource, action)
+
+        if self.session is None:
+            raise Exception('No user session established, call login first!')
+
+        action, url_path, query_params = self.build_request(resource, action, resource_path, json_data)
+
+        # Read the body before the connection is released back to the pool
+        async with self.session.request(action, self.api_url + url_path, json=query_params) as response:
+            await response.read()
+
+        return response
+
+    def generate_mocked_response(self, resource, action):
+        """ Create mock response object.
+
+        :param resource: The name of the resource that the action should be performed on.
+        :param action: The REST verb that needs to be performed on the resource.
+
+        :return: A MockedResponse object.
+        """
+        return MockedResponse(
+            self.response_key[action.upper()],
+            {'message': 'No changes made to {resource}'.format(resource=resource)},
+        )
+
+    async def gather(self, operations, limit=None, return_exceptions=False):
+        """ Invoke many operations concurrently while bounding the number of requests in flight.
+
+        :param operations: Iterable of dictionaries holding the `invoke` arguments for each operation.
+        :param limit: Maximum number of concurrent requests, defaults to the `limit` given on creation.
+        :param return_exceptions: Return raised exceptions in place of responses rather than raising the first one.
+
+        :return: List of responses in the same order as `operations`.
+
+        :raises: Exception: The first exception raised by an operation, unless `return_exceptions` is set. Operations
+            that have not finished yet are cancelled before it is raised.
+        """
+        semaphore = asyncio.Semaphore(limit or self.limit)
+
+        async def bounded_invoke(operation):
+            async with semaphore:
+                return await self.invoke(**operation)
+
+        tasks = [asyncio.ensure_future(bounded_invoke(operation)) for operation in operations]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            # asyncio.gather leaves the remaining operations running, don't let them outlive the call
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -0,0 +1,105 @@
+""" Compare memory held by the raw Gateway API specification with `ApiSpec`.
+
+Usage:
+    python benchmark_spec_memory.py [path/to/gateway_api.json] [--touch N]
+
+Without a path, a synthetic specification shaped like `gateway_api.json` is generated. Measuring relies on
+`tracemalloc`, so the benchmark needs Python 3.4 or greater even though `ApiSpec` itself supports Python 2.7.
+"""
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+
+sys.path.append('../')
+from bluecat import ApiSpec  # noqa
+
+
+def generate_api_json(resource_count=500, depth=4):
+    """ Build a synthetic `gateway_api.json` document with nested resource paths for every resource. """
+    resources = {}
+    for index in range(resource_count):
+        name = 'resource{}'.format(index)
+        parents = ['parent{}'.format((index + level) % 50) for level in range(depth)]
+        actions = {}
+        for action in ['get', 'post', 'patch', 'delete']:
+            paths = []
+            path_parameters = {}
+            for level in range(depth):
+                segments = parents[:level] + [name]
+                path = ''.join('/{0}s/{{{0}}}'.format(segment) for segment in segments) + '/'
+                paths.append(path)
+                path_parameters[path] = {
+                    segment: {
+                        'in': 'path',
+                        'name': segment,
+                        'required': 'true',
+                        'type': 'string',
+                        'description': 'Name or ID of the {} the request applies to.'.format(segment),
+                    }
+                    for segment in segments
+                }
+            actions[action] = {
+                'description': 'Perform {} against {} resources in BlueCat Address Manager.'.format(action, name),
+                'paths': paths,
+                'path_parameters': path_parameters,
+                'query_parameters': {
+                    param: {
+                        'in': 'body',
+                        'name': param,
+                        'required': 'false',
+                        'type': param_type,
+                        'description': 'The {} of the {}.'.format(param, name),
+                    }
+                    for param, param_type in [('name', 'string'), ('id', 'integer'), ('properties', 'string'),
+                                              ('deployable', 'boolean'), ('ttl', 'integer')]
+                },
+            }
+        resources[name] = actions
+    return {'resources': resources}
+
+
+def measure(build):
+    """ Return the object produced by `build` and the bytes it still holds once built. """
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('path', nargs='?', help='gateway_api.json file to measure')
+    parser.add_argument('--touch', type=int, default=10, help='number of resources to look up in the ApiSpec')
+    args = parser.parse_args()
+
+    if args.path:
+        with open(args.path) as api_json_file:
+            text = api_json_file.read()
+    else:
+        text = json.dumps(generate_api_json())
+
+    raw, raw_size = measure(lambda: json.loads(text)['resources'])
+    del raw
+
+    def build_spec():
+        spec = ApiSpec(json.loads(text)['resources'])
+        for resource in list(spec)[:args.touch]:
+            for route in spec[resource].values():
+                route['path_parameters']
+        return spec
+
+    spec, spec_size = measure(build_spec)
+
+    print('resources:           {}'.format(len(spec)))
+    print('raw dict:            {:>12,} bytes'.format(raw_size))
+    print('ApiSpec ({} loaded): {:>12,} bytes'.format(min(args.touch, len(spec)), spec_size))
+    print('ratio:               {:>12.1f}x'.format(float(raw_size) / spec_size))
+
+
+if __name__ == '__main__':
+    main()
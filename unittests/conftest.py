@@ -0,0 +1,11 @@
+import sys
+
+# The asynchronous client and its tests need Python 3.8 or greater and aiohttp
+collect_ignore = []
+try:
+    import aiohttp  # noqa
+except ImportError:
+    collect_ignore.append('test_bluecat_async.py')
+else:
+    if sys.version_info < (3, 8):
+        collect_ignore.append('test_bluecat_async.py')
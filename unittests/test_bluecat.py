@@ -5,7 +5,7 @@ import unittest
 import mock
 
 sys.path.append('../')
-from bluecat import Gateway  # noqa
+from bluecat import ApiSpec, Gateway  # noqa
 
 
 class TestBluecat(unittest.TestCase):
@@ -245,6 +245,44 @@ class TestBluecat(unittest.TestCase):
 
         self.assertEqual(len(paths), 0)
 
+    def test_api_spec(self):
+        with mock.patch.object(ApiSpec, '_load', autospec=True, side_effect=ApiSpec._load) as mocked_load:
+            spec = ApiSpec(self.api_json['resources'])
+
+            self.assertEqual(list(spec), ['resource_name'])
+            mocked_load.assert_not_called()
+
+            definition = spec['resource_name']['get']
+
+            self.assertIs(spec['resource_name'], spec['resource_name'])
+            self.assertEqual(mocked_load.call_count, 1)
+
+        raw_definition = self.api_json['resources']['resource_name']['get']
+
+        self.assertEqual(definition['query_parameters']['PARAM2']['type'], 'integer')
+        self.assertEqual(list(definition['path_parameters']), list(raw_definition['path_parameters']))
+        self.assertIs(
+            definition['path_parameters']['/RESOURCE_NAME1/{path_param1}/RESOURCE_NAME2/{path_param2}/'],
+            definition['path_parameters']['/RESOURCE_NAME2/{path_param2}/RESOURCE_NAME1/{path_param1}/'],
+        )
+        self.assertDictEqual(
+            self.object.parse_query_params(definition),
+            self.object.parse_query_params(raw_definition),
+        )
+
+        resources = OrderedDict([('path_param1', 'resource_path1'), ('path_param2', 'resource_path2')])
+        self.assertDictEqual(
+            self.object.parse_path_params(definition, resources),
+            self.object.parse_path_params(raw_definition, resources),
+        )
+
+        with self.assertRaises(KeyError):
+            spec['unknown_resource']
+        with self.assertRaises(KeyError):
+            definition['paths']
+        with self.assertRaises(KeyError):
+            definition['query_parameters']['PARAM1']['description']
+
 
 def suite():
     suite = unittest.TestLoader().loadTestsFromTestCase(TestBluecat)
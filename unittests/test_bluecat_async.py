@@ -0,0 +1,320 @@
+import asyncio
+import socket
+import sys
+import unittest
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import mock
+
+sys.path.append('../')
+from bluecat_async import AsyncGateway, MockedResponse  # noqa
+
+API_JSON = {
+    'resource_name': {
+        'get': {
+            'query_parameters': {
+                'PARAM1': {
+                    'name': 'PARAM1',
+                    'in': 'body',
+                    'required': 'false',
+                    'type': 'integer',
+                },
+            },
+            'path_parameters': {
+                '/RESOURCE_NAME1/{path_param1}/': {
+                    'path_param1': {
+                        'in': 'path',
+                        'name': 'path_param1',
+                        'required': 'true',
+                        'type': 'string',
+                    }
+                },
+                '/RESOURCE_NAME1/': {},
+            },
+        },
+    },
+}
+
+
+class FakeResponse(object):
+    def __init__(self, status=200):
+        self.status = status
+        self.read = mock.AsyncMock(return_value=b'{}')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class FakeSession(object):
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []
+        self.post = mock.MagicMock(return_value=FakeResponse())
+        self.get = mock.MagicMock(return_value=FakeResponse())
+        self.close = mock.AsyncMock()
+
+    def request(self, method, url, json=None):
+        self.requests.append((method, url, json))
+        session = self
+
+        class TrackedResponse(FakeResponse):
+            async def __aenter__(self):
+                session.in_flight += 1
+                session.max_in_flight = max(session.max_in_flight, session.in_flight)
+                await asyncio.sleep(0)
+                return self
+
+            async def __aexit__(self, exc_type, exc_value, traceback):
+                session.in_flight -= 1
+                return False
+
+        return TrackedResponse()
+
+
+class TestAsyncBluecat(unittest.TestCase):
+    def setUp(self):
+        self.object = AsyncGateway(
+            api_json=API_JSON,
+            protocol='http',
+            domain='test_server',
+            version=1,
+            username='test_username',
+            password='test_password',
+            limit=5,
+        )
+        self.object.session = FakeSession()
+
+    def test_invoke(self):
+        asyncio.run(self.object.invoke(
+            'resource_name',
+            'GET',
+            resource_path=[{'path_param1': 'resource_path1'}],
+            json_data={'PARAM1': '100'},
+        ))
+
+        self.assertEqual(
+            self.object.session.requests,
+            [('get', 'http://test_server/api/v1/RESOURCE_NAME1/resource_path1/', {'PARAM1': 100})],
+        )
+        self.object.session.post.assert_not_called()
+
+    def test_invoke_without_session(self):
+        self.object.session = None
+
+        with self.assertRaises(Exception):
+            asyncio.run(self.object.invoke('resource_name', 'GET'))
+
+    def test_gather(self):
+        session = self.object.session
+        operations = [
+            {'resource': 'resource_name', 'action': 'GET', 'resource_path': [{'path_param1': str(index)}]}
+            for index in range(20)
+        ]
+
+        responses = asyncio.run(self.object.gather(operations))
+
+        self.assertEqual(len(responses), 20)
+        self.assertEqual(session.max_in_flight, 5)
+        self.assertEqual(
+            [url for _, url, _ in session.requests],
+            ['http://test_server/api/v1/RESOURCE_NAME1/{}/'.format(index) for index in range(20)],
+        )
+
+    def test_gather_cancels_on_failure(self):
+        session = self.object.session
+        operations = [
+            {'resource': 'resource_name', 'action': 'GET', 'resource_path': [{'path_param1': str(index)}]}
+            for index in range(21)
+        ]
+        operations[7]['resource_path'] = [{'unknown': '7'}]
+
+        async def gather_and_wait():
+            with self.assertRaisesRegex(Exception, 'do not match any valid paths'):
+                await self.object.gather(operations)
+            sent = len(session.requests)
+
+            await asyncio.sleep(0.01)
+
+            self.assertEqual(len(session.requests), sent)
+            self.assertEqual(asyncio.all_tasks(), {asyncio.current_task()})
+            return sent
+
+        self.assertLess(asyncio.run(gather_and_wait()), 20)
+
+    def test_logout(self):
+        session = self.object.session
+
+        asyncio.run(self.object.logout())
+
+        session.get.assert_called_with('http://test_server/logout')
+        session.close.assert_called_once_with()
+        self.assertIsNone(self.object.session)
+
+    def test_invoke_mocked(self):
+        self.object.mocked = True
+
+        response = asyncio.run(self.object.invoke('resource_name', 'POST'))
+
+        self.assertIsInstance(response, MockedResponse)
+        self.assertEqual(response.status, 201)
+        self.assertEqual(asyncio.run(response.json()), {'message': 'No changes made to resource_name'})
+
+        response = asyncio.run(self.object.invoke('resource_name', 'PATCH'))
+
+        self.assertEqual(response.status, 204)
+
+        asyncio.run(self.object.invoke('resource_name', 'GETALL'))
+
+        self.assertEqual(self.object.session.requests, [('get', 'http://test_server/api/v1/RESOURCE_NAME1/', {})])
+
+    @mock.patch('bluecat_async.aiohttp.CookieJar', wraps=aiohttp.CookieJar)
+    @mock.patch('bluecat_async.aiohttp.TCPConnector', wraps=aiohttp.TCPConnector)
+    def test_create_session(self, mocked_connector, mocked_cookie_jar):
+        async def create_and_close(gateway):
+            await gateway.create_session().close()
+
+        asyncio.run(create_and_close(self.object))
+
+        mocked_connector.assert_called_with(limit=5, ssl=True)
+        mocked_cookie_jar.assert_called_with(unsafe=True)
+
+        self.object.ssl = False
+        asyncio.run(create_and_close(self.object))
+
+        mocked_connector.assert_called_with(limit=5, ssl=False)
+
+
+class TestAsyncBluecatSession(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.logins = 0
+        self.login_status = 200
+
+        async def rest_login(request):
+            self.logins += 1
+            response = web.Response(status=self.login_status)
+            response.set_cookie('session', 'test_session')
+            return response
+
+        async def logout(request):
+            return web.Response()
+
+        async def gateway_api_json(request):
+            return web.json_response({'resources': API_JSON})
+
+        async def resource(request):
+            return web.json_response({'cookie': request.cookies.get('session')})
+
+        app = web.Application()
+        app.router.add_post('/rest_login', rest_login)
+        app.router.add_get('/logout', logout)
+        app.router.add_get('/api/v1/gateway_api_json/', gateway_api_json)
+        app.router.add_get('/api/v1/RESOURCE_NAME1/{path_param1}/', resource)
+
+        # Use an IP address host, whose cookies aiohttp ignores by default
+        self.server = TestServer(app, host='127.0.0.1')
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    def create_gateway(self, api_json=API_JSON, port=None):
+        return AsyncGateway(
+            api_json=api_json,
+            protocol='http',
+            domain='127.0.0.1:{}'.format(port or self.server.port),
+            version=1,
+            username='test_username',
+            password='test_password',
+        )
+
+    def track_sessions(self, gateway):
+        sessions = []
+        original_create_session = gateway.create_session
+
+        def create_session():
+            sessions.append(original_create_session())
+            return sessions[-1]
+
+        return sessions, mock.patch.object(gateway, 'create_session', side_effect=create_session)
+
+    async def test_session_reused(self):
+        async with self.create_gateway() as gateway:
+            responses = [
+                await gateway.invoke('resource_name', 'GET', resource_path=[{'path_param1': str(index)}])
+                for index in range(3)
+            ]
+
+            self.assertEqual([await response.json() for response in responses], [{'cookie': 'test_session'}] * 3)
+
+        self.assertEqual(self.logins, 1)
+        self.assertIsNone(gateway.session)
+
+    async def test_login_requests_api_json(self):
+        gateway = self.create_gateway(api_json={})
+
+        async with gateway:
+            response = await gateway.invoke('resource_name', 'GET', resource_path=[{'path_param1': 'path1'}])
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(list(gateway.json), ['resource_name'])
+
+    async def test_failed_login_closes_session(self):
+        with socket.socket() as unused:
+            unused.bind(('127.0.0.1', 0))
+            port = unused.getsockname()[1]
+
+        gateway = self.create_gateway(port=port)
+        sessions, patch_create_session = self.track_sessions(gateway)
+        with patch_create_session:
+            with self.assertRaises(aiohttp.ClientConnectionError):
+                async with gateway:
+                    pass
+
+        self.assertTrue(sessions[0].closed)
+        self.assertIsNone(gateway.session)
+
+    async def test_rejected_login_closes_session(self):
+        self.login_status = 401
+
+        gateway = self.create_gateway()
+        sessions, patch_create_session = self.track_sessions(gateway)
+        with patch_create_session:
+            with self.assertRaises(aiohttp.ClientResponseError):
+                async with gateway:
+                    pass
+
+        self.assertEqual(self.logins, 1)
+        self.assertTrue(sessions[0].closed)
+        self.assertIsNone(gateway.session)
+
+    async def test_gather_return_exceptions(self):
+        async with self.create_gateway() as gateway:
+            responses = await gateway.gather(
+                [
+                    {'resource': 'resource_name', 'action': 'GET', 'resource_path': [{'path_param1': 'path1'}]},
+                    {'resource': 'resource_name', 'action': 'GET', 'resource_path': [{'unknown': 'path1'}]},
+                ],
+                return_exceptions=True,
+            )
+
+        self.assertEqual(responses[0].status, 200)
+        self.assertIsInstance(responses[1], Exception)
+
+
+def suite():
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite([
+        loader.loadTestsFromTestCase(TestAsyncBluecat),
+        loader.loadTestsFromTestCase(TestAsyncBluecatSession),
+    ])
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()